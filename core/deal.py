@@ -5,6 +5,8 @@ class Deal:
     """A deal object defining an instrument and quantity along with metadata
     of who the instrument is traded with."""
 
+    __slots__ = ('instrument', 'quantity', '_creation_time', 'counterparty')
+
     def __init__(
             self,
             instrument,
@@ -14,9 +16,18 @@ class Deal:
     ):
         self.instrument = instrument
         self.quantity = quantity
-        self.creation_time = creation_time or datetime.datetime.now()
+        self._creation_time = creation_time
         self.counterparty = counterparty
 
+    @property
+    def creation_time(self):
+        """Timestamp of when the deal was first observed. Taken lazily so
+        constructing a large portfolio does not pay one clock syscall per
+        deal."""
+        if self._creation_time is None:
+            self._creation_time = datetime.datetime.now()
+        return self._creation_time
+
     def __repr__(self):
         return f'Deal(instrument={self.instrument}, ' \
                f'quantity={self.quantity}, ' \
@@ -1,25 +1,319 @@
+import datetime
+import multiprocessing
+from collections import defaultdict
+
+import numpy as np
+from scipy.special import ndtr
+
+from instruments.equity.options import mc_kernel, strategies
+from instruments.equity.options.options import AmericanOption, EuropeanOption
+from instruments.equity.options.pricing_engine import PricingEngineKind
+
+# Below this many deals the pool spawn/pickle overhead outweighs the win.
+_SERIAL_THRESHOLD = 32
+
+# Engine-kind codes stored per deal in the structure-of-arrays layout.
+ENGINE_KIND_FALLBACK = 0
+ENGINE_KIND_ANALYTIC_EURO = 1
+ENGINE_KIND_MC_AMERICAN = 2
+
+_INITIAL_CAPACITY = 8
+
+
+def _price_one(instrument, quantity, market_data_object):
+    """Prices a single position. Module level so it can cross the pickle
+    boundary into worker processes."""
+    return instrument.price(market_data_object) * quantity
+
+
+def _classify_engine_kind(instrument):
+    """Engine-kind code used to bucket deals for batched pricing. The
+    engine's integer kind replaces isinstance checks on the engine
+    classes."""
+    engine = getattr(instrument, 'pricing_engine', None)
+    kind = getattr(engine, 'kind', None)
+    if (
+            kind == PricingEngineKind.ANALYTIC_EUROPEAN
+            and isinstance(instrument, EuropeanOption)
+    ):
+        return ENGINE_KIND_ANALYTIC_EURO
+    if (
+            kind == PricingEngineKind.MC_AMERICAN
+            and isinstance(instrument, AmericanOption)
+    ):
+        return ENGINE_KIND_MC_AMERICAN
+    return ENGINE_KIND_FALLBACK
+
 
 class Portfolio:
-    """An object for holding deals (a deal being an instrument and quantity)."""
+    """An object for holding deals (a deal being an instrument and quantity).
+
+    Alongside the deal store the portfolio keeps a structure-of-arrays
+    mirror (quantities, strikes, maturities, call/put signs, engine kinds)
+    so batched pricers can slice contiguous NumPy arrays instead of walking
+    scattered Python objects. Deals are classified when added; if an
+    instrument's pricing engine is swapped afterwards, rebuild the
+    portfolio so the classification stays in sync.
+    """
 
     def __init__(self):
         self.deals = {}
-        self.deal_counter = 0
+        self._instruments = []
+        self._asset_names = []
+        self._quantities = np.empty(_INITIAL_CAPACITY)
+        self._strikes = np.empty(_INITIAL_CAPACITY)
+        self._maturities = np.empty(_INITIAL_CAPACITY, dtype='datetime64[D]')
+        self._cp_signs = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        self._engine_kinds = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
 
     def __repr__(self):
-        return '\n'.join([f'{key}: {val}' for key, val in self.deals.items()])
+        # Generator feeds join directly: no intermediate list of N
+        # formatted strings for large portfolios.
+        return '\n'.join(f'{key}: {val}' for key, val in self.deals.items())
+
+    def __len__(self):
+        return len(self._instruments)
 
     def add_deal(self, deal):
         """Adds a deal to the portfolio object."""
-        self.deals[self.deal_counter] = deal
-        self.deal_counter += 1
+        index = len(self._instruments)
+        if index == len(self._quantities):
+            self._grow(2 * index)
+
+        instrument = deal.instrument
+        engine_kind = _classify_engine_kind(instrument)
+        self._quantities[index] = deal.quantity
+        self._engine_kinds[index] = engine_kind
+        if engine_kind != ENGINE_KIND_FALLBACK:
+            self._strikes[index] = instrument.strike
+            self._maturities[index] = instrument.maturity
+            self._cp_signs[index] = int(instrument.call_or_put)
+        else:
+            self._strikes[index] = np.nan
+            self._maturities[index] = np.datetime64('NaT')
+            self._cp_signs[index] = 0
+
+        self._instruments.append(instrument)
+        self._asset_names.append(getattr(instrument, 'asset_name', None))
+        self.deals[index] = deal
+
+    def _grow(self, capacity):
+        """Doubles the structure-of-arrays backing store."""
+        self._quantities = np.resize(self._quantities, capacity)
+        self._strikes = np.resize(self._strikes, capacity)
+        self._maturities = np.resize(self._maturities, capacity)
+        self._cp_signs = np.resize(self._cp_signs, capacity)
+        self._engine_kinds = np.resize(self._engine_kinds, capacity)
+
+    def price(self, market_data_object, workers=None):
+        """Prices all the deals given a market data object.
+
+        Analytically-priced European options are priced together in a single
+        vectorized closed-form Black-Scholes pass; all other deals fall back
+        to their instrument's own pricing path.
+
+        Deals are independent, so with ``workers`` > 1 the per-deal pricing
+        fans out over a process pool and the results are summed. Small
+        portfolios always price serially as pool start-up costs more than
+        the pricing itself.
+
+        :param MarketDataObject market_data_object: Market data to price with
+        :param int workers: Number of worker processes; None or 1 prices
+            serially
+        :return float: Total portfolio PV
+        """
+        if (
+                workers is None
+                or workers <= 1
+                or len(self.deals) < _SERIAL_THRESHOLD
+        ):
+            return self._price_serial(market_data_object)
+
+        params = [
+            (deal.instrument, deal.quantity, market_data_object)
+            for deal in self.deals.values()
+        ]
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.starmap(_price_one, params)
+        return sum(results)
 
-    def price(self, market_data_object):
-        """Prices all the deals given a market data object."""
-        total_pv = 0
-        for index, deal in self.deals.items():
+    def _price_serial(self, market_data_object):
+        """Prices every deal in-process.
+
+        Fallback deals referencing structurally-equal instruments are
+        aggregated first so each unique instrument is priced once and
+        scaled by the summed quantity.
+        """
+        total_pv = self._price_analytical_batch(market_data_object)
+        total_pv += self._price_american_batch(market_data_object)
+
+        num_deals = len(self._instruments)
+        fallback_deals = [
+            self.deals[i] for i in np.nonzero(
+                self._engine_kinds[:num_deals] == ENGINE_KIND_FALLBACK
+            )[0]
+        ]
+        aggregated_quantities = defaultdict(float)
+        undeduped_deals = []
+        for deal in fallback_deals:
+            if deal.instrument.dedup_safe:
+                aggregated_quantities[deal.instrument] += deal.quantity
+            else:
+                undeduped_deals.append(deal)
+
+        for instrument, quantity in aggregated_quantities.items():
+            total_pv += instrument.price(market_data_object) * quantity
+        for deal in undeduped_deals:
             instr_npv = deal.instrument.price(market_data_object)
-            position_npv = instr_npv * deal.quantity
-            total_pv += position_npv
+            total_pv += instr_npv * deal.quantity
+
+        return total_pv
+
+    @staticmethod
+    def set_mc_rng_buffer(num_paths, time_steps, seed=42):
+        """Pre-samples the shared normals buffer used by all Monte-Carlo
+        pricings in the sweep (common random numbers); see
+        mc_kernel.set_rng_buffer. Memoized Monte-Carlo NPVs are dropped
+        since they were drawn from the previous stream."""
+        strategies.clear_price_cache()
+        return mc_kernel.set_rng_buffer(
+            num_paths=num_paths, time_steps=time_steps, seed=seed
+        )
+
+    def clear_pricing_caches(self):
+        """Clears cached pricing state on all held instruments. Call after
+        mutating a market data object in place so instruments do not reuse
+        stale QuantLib processes or engines."""
+        strategies.clear_price_cache()
+        for deal in self.deals.values():
+            clear = getattr(deal.instrument, 'clear_pricing_cache', None)
+            if clear is not None:
+                clear()
+
+    def _price_analytical_batch(self, market_data_object):
+        """Prices all analytically-priced European options in one closed-form
+        Black-Scholes evaluation over the structure-of-arrays slices,
+        avoiding the per-deal QuantLib process and engine construction.
+
+        :param MarketDataObject market_data_object: Market data to price with
+        :return float: PV of the batched deals
+        """
+        num_deals = len(self._instruments)
+        batch_mask = (
+            self._engine_kinds[:num_deals] == ENGINE_KIND_ANALYTIC_EURO
+        )
+        if not batch_mask.any():
+            return 0.0
+
+        today = np.datetime64(datetime.date.today(), 'D')
+        rfr = market_data_object.asset_lookup('rfr').interest_rate
+
+        batch_indices = np.nonzero(batch_mask)[0]
+        strikes = self._strikes[batch_indices]
+        maturities = (
+            self._maturities[batch_indices] - today
+        ).astype(np.float64) / 365
+        quantities = self._quantities[batch_indices]
+        cp_signs = self._cp_signs[batch_indices].astype(np.float64)
+        spots = np.fromiter(
+            (
+                market_data_object.asset_lookup(self._asset_names[i]).spot
+                for i in batch_indices
+            ),
+            dtype=np.float64, count=len(batch_indices)
+        )
+        vols = np.fromiter(
+            (
+                market_data_object.asset_lookup(
+                    self._asset_names[i]
+                ).volatility
+                for i in batch_indices
+            ),
+            dtype=np.float64, count=len(batch_indices)
+        )
+
+        # Expired deals price at zero, mirroring QuantLib's expired
+        # handling; without the mask their negative maturities would NaN
+        # the whole batch.
+        live = maturities > 0
+        if not live.all():
+            strikes = strikes[live]
+            maturities = maturities[live]
+            quantities = quantities[live]
+            cp_signs = cp_signs[live]
+            spots = spots[live]
+            vols = vols[live]
+            if len(strikes) == 0:
+                return 0.0
+
+        # HACK HACK HACK for dividends (mirrors standard_option_strategy)
+        div = 0
+        vol_sqrt_t = vols * np.sqrt(maturities)
+        d1 = (
+            np.log(spots / strikes)
+            + (rfr - div + 0.5 * vols * vols) * maturities
+        ) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        prices = cp_signs * (
+            spots * np.exp(-div * maturities) * ndtr(cp_signs * d1)
+            - strikes * np.exp(-rfr * maturities) * ndtr(cp_signs * d2)
+        )
+
+        return float(np.dot(prices, quantities))
+
+    def _price_american_batch(self, market_data_object):
+        """Prices all MC-priced American options through the shared
+        Longstaff-Schwartz kernel, grouped by (asset, maturity) so each
+        group amortises one set of GBM paths across its options.
+
+        :param MarketDataObject market_data_object: Market data to price with
+        :return float: PV of the batched deals
+        """
+        num_deals = len(self._instruments)
+        batch_indices = np.nonzero(
+            self._engine_kinds[:num_deals] == ENGINE_KIND_MC_AMERICAN
+        )[0]
+        if len(batch_indices) == 0:
+            return 0.0
+
+        today = datetime.date.today()
+        rfr = market_data_object.asset_lookup('rfr').interest_rate
+
+        groups = defaultdict(list)
+        for i in batch_indices:
+            instrument = self._instruments[i]
+            groups[(self._asset_names[i], instrument.maturity)].append(i)
+
+        total_pv = 0.0
+        for (asset_name, maturity_date), group in groups.items():
+            asset = market_data_object.asset_lookup(asset_name)
+            instruments = [self._instruments[i] for i in group]
+            maturity = (maturity_date - today).days / 365
+            num_paths = max(instr.mc_num_paths for instr in instruments)
+            num_steps = max(instr.mc_time_steps for instr in instruments)
+            # HACK HACK HACK for dividends (mirrors standard_option_strategy)
+            paths = mc_kernel.gbm_paths(
+                spot=asset.spot,
+                maturity=maturity,
+                rfr=rfr,
+                div=0,
+                vol=asset.volatility,
+                num_paths=num_paths,
+                num_steps=num_steps,
+                seed=instruments[0].mc_seed,
+            )
+            strikes = np.array([instr.strike for instr in instruments])
+            cp_signs = np.array(
+                [float(int(instr.call_or_put)) for instr in instruments]
+            )
+            prices = mc_kernel.lsm_american_npv_batch(
+                paths=paths,
+                strikes=strikes,
+                cp_signs=cp_signs,
+                rfr=rfr,
+                dt=maturity / num_steps,
+            )
+            quantities = self._quantities[np.asarray(group)]
+            total_pv += float(np.dot(prices, quantities))
 
         return total_pv
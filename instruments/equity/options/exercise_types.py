@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-import QuantLib as ql
-from instruments.instrument_helpers import dt_2_qldt
+from instruments.instrument_helpers import dt_2_qldt, get_ql
 
 
 class ExerciseType(ABC):
@@ -15,13 +14,13 @@ class EuropeanExercise(ExerciseType):
 
     @staticmethod
     def exercise(instrument):
-        return ql.EuropeanExercise(dt_2_qldt(instrument.maturity))
+        return get_ql().EuropeanExercise(dt_2_qldt(instrument.maturity))
 
 
 class AmericanExercise(ExerciseType):
 
     @staticmethod
     def exercise(instrument):
-        return ql.AmericanExercise(
+        return get_ql().AmericanExercise(
             dt_2_qldt(instrument.earliest_date), dt_2_qldt(instrument.maturity)
         )
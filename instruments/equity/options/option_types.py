@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-import QuantLib as ql
+from instruments.instrument_helpers import get_ql
 
 
 class OptionType(ABC):
@@ -14,4 +14,4 @@ class VanillaOption(OptionType):
 
     @staticmethod
     def option_obj(instrument):
-        return ql.VanillaOption(instrument.pay_off, instrument.exercise)
+        return get_ql().VanillaOption(instrument.pay_off, instrument.exercise)
@@ -1,20 +1,31 @@
+import datetime
 from abc import ABC, abstractmethod, ABCMeta
+from collections import OrderedDict
 from functools import cached_property
-import QuantLib as ql
+from operator import attrgetter
+
+import numpy as np
 from instruments.instrument import BaseInstrument
+from instruments.instrument_helpers import get_ql
 from instruments.equity.options.payoffs import PlainVanillaPayoff
 from instruments.equity.options.exercise_types import EuropeanExercise, AmericanExercise
+from instruments.equity.options.bs_kernel import bs_delta, bs_npv_vec
+from instruments.equity.options.mc_kernel import mc_european_npv
 from instruments.equity.options.pricing_engine import (
-    EuropeanAnalyticalEngine, EuropeanMCEngine, AmericanMCEngine
+    EuropeanAnalyticalEngine, EuropeanMCEngine, AmericanMCEngine,
+    PricingEngineKind
 )
 from instruments.equity.options.processes import StandardBSMProcess
 from instruments.equity.options.option_types import VanillaOption
 from instruments.equity.options.strategies import (
-    StandardOptionStrategy, StandardMdoInterpreter
+    standard_option_strategy, standard_mdo_interpreter
 )
 
 # TODO 1) Add a repr for options
-# TODO 2) Test and equality dunder method
+
+# C-level fast path for equality/hashing: one attrgetter call instead of
+# per-attribute dict lookups and list allocations.
+_EQ_KEY = attrgetter('_asset_name', '_strike', '_maturity')
 
 
 class Option(BaseInstrument, ABC):
@@ -23,8 +34,36 @@ class Option(BaseInstrument, ABC):
     - Call or put
     - Exercise type
     - Pay off type
+
+    The QuantLib option, exercise and pay off objects are built exactly
+    once per instance via cached_property; subclasses must not override
+    these as plain properties or the SWIG construction cost comes back on
+    every price call.
     """
 
+    # Slot descriptors give C-level access on the attributes hit in the
+    # pricing hot path; '__dict__' is kept so cached_property and the
+    # temporary MC settings hack still have somewhere to live.
+    __slots__ = (
+        '_asset_name',
+        '_strike',
+        '_maturity',
+        '_pay_off_type',
+        '_exercise_type',
+        '_option_type',
+        '_mdo_interpreter',
+        '_underlying_process',
+        '_pricing_strategy',
+        '_pricing_engine',
+        '_pricing_cache',
+        '_engine_cache',
+        '__dict__',
+    )
+
+    # Small LRU bound: a batch reprice hits the same market data repeatedly,
+    # so only a handful of distinct fingerprints are ever live at once.
+    PRICING_CACHE_SIZE = 4
+
     def __init__(
             self,
             asset_name,
@@ -54,10 +93,12 @@ class Option(BaseInstrument, ABC):
         self._pay_off_type = pay_off_type
         self._exercise_type = exercise_type
         self._option_type = option_type
-        self._mdo_interpreter = mdo_interpreter or StandardMdoInterpreter()
+        self._mdo_interpreter = mdo_interpreter or standard_mdo_interpreter
         self._underlying_process = underlying_process or StandardBSMProcess()
-        self._pricing_strategy = pricing_strategy or StandardOptionStrategy()
+        self._pricing_strategy = pricing_strategy or standard_option_strategy
         self._pricing_engine = pricing_engine or self.default_pricing_engine()
+        self._pricing_cache = OrderedDict()
+        self._engine_cache = {}
 
     @property
     def strike(self):
@@ -108,10 +149,9 @@ class Option(BaseInstrument, ABC):
     def underlying_process(self):
         return self._underlying_process
 
-    @property
-    @abstractmethod
-    def valid_pricing_engines(self):
-        raise NotImplementedError("Valid pricing engines must be specified.")
+    # Class-level frozenset of valid engine types: O(1) membership with
+    # no per-access list allocation. Subclasses must override.
+    valid_pricing_engines = frozenset()
 
     @property
     @abstractmethod
@@ -121,14 +161,125 @@ class Option(BaseInstrument, ABC):
         )
 
     def validate_engine(self, pricing_engine):
-        if pricing_engine not in self.valid_pricing_engines:
+        engine_type = (
+            pricing_engine if isinstance(pricing_engine, type)
+            else type(pricing_engine)
+        )
+        if engine_type not in self.valid_pricing_engines:
             raise NotImplementedError(
-                f"Pricing engine {pricing_engine} not in list "
+                f"Pricing engine {pricing_engine} not in set "
                 f"of valid engines: {self.valid_pricing_engines}."
             )
         else:
             return pricing_engine
 
+    def cached_process_and_engine(self, spot, vol, rfr, div):
+        """Returns the QuantLib (process, engine) pair for the given market
+        data, rebuilding them only when the fingerprint changes.
+
+        Constructing the BSM process and engine crosses SWIG several times
+        per call; a portfolio-wide reprice at unchanged market data reuses
+        one pair per option instead.
+
+        :param float spot: Spot price of the underlying
+        :param float vol: Volatility in standard units
+        :param float rfr: Risk free rate
+        :param float div: Dividend yield
+        :return (process, engine): QuantLib process and pricing engine
+        """
+        if self._underlying_process.mutable:
+            # The process keeps one object graph alive and rebinds its
+            # quote values, so there is nothing to fingerprint: the call
+            # is the cache.
+            process = self.underlying_process(
+                spot=spot, vol=vol, rfr=rfr, div=div
+            )
+            return process, self._cached_engine(process)
+
+        key = (
+            spot, vol, rfr, div,
+            get_ql().Settings.instance().evaluationDate.serialNumber()
+        )
+        process = self._pricing_cache.get(key)
+        if process is not None:
+            self._pricing_cache.move_to_end(key)
+        else:
+            process = self.underlying_process(
+                spot=spot, vol=vol, rfr=rfr, div=div
+            )
+            self._pricing_cache[key] = process
+            if len(self._pricing_cache) > self.PRICING_CACHE_SIZE:
+                _, evicted = self._pricing_cache.popitem(last=False)
+                self._evict_engines_for(evicted)
+
+        return process, self._cached_engine(process)
+
+    def _cached_engine(self, process):
+        """Returns the pricing engine for the given process, building it at
+        most once per (engine choice, process, MC settings) combination.
+
+        Engines are deterministic functions of the process and MC settings,
+        so a process cache hit with unchanged settings skips the SWIG
+        engine allocation entirely.
+        """
+        key = (
+            self._pricing_engine,
+            id(process),
+            getattr(self, 'mc_num_paths', None),
+            getattr(self, 'mc_time_steps', None),
+            getattr(self, 'mc_rng', None),
+        )
+        engine = self._engine_cache.get(key)
+        if engine is None:
+            engine = self.pricing_engine(
+                instrument=self, underlying_process=process
+            )
+            self._engine_cache[key] = engine
+        return engine
+
+    def _evict_engines_for(self, process):
+        """Drops engine cache entries tied to an evicted process so the
+        id-keyed entries cannot alias a recycled object."""
+        evicted_id = id(process)
+        self._engine_cache = {
+            key: engine for key, engine in self._engine_cache.items()
+            if key[1] != evicted_id
+        }
+
+    def clear_pricing_cache(self):
+        """Drops cached QuantLib processes and engines. Call after mutating
+        market data in place so stale handles are not reused."""
+        self._pricing_cache.clear()
+        self._engine_cache.clear()
+
+    def __eq__(self, other):
+        """Options are equal when they are the same concrete type, priced
+        through the same engine type, and agree on asset, strike and
+        maturity."""
+        return (
+            type(self) is type(other)
+            and type(self._pricing_engine) is type(other._pricing_engine)
+            and _EQ_KEY(self) == _EQ_KEY(other)
+        )
+
+    def __hash__(self):
+        return hash(
+            (type(self), type(self._pricing_engine), _EQ_KEY(self))
+        )
+
+    def __getstate__(self):
+        # Cached QuantLib objects are SWIG proxies that cannot cross the
+        # pickle boundary (e.g. into pricing worker processes); drop them
+        # here and let them rebuild lazily on the other side.
+        dict_state, slots_state = super().__getstate__()
+        dict_state = dict(dict_state or {})
+        for cached in ('option_obj', 'exercise', 'pay_off'):
+            dict_state.pop(cached, None)
+        slots_state = dict(slots_state or {})
+        slots_state['_pricing_cache'] = OrderedDict()
+        slots_state['_engine_cache'] = {}
+        return dict_state, slots_state
+
     @property
     def pricing_strategy(self):
         return self._pricing_strategy
@@ -145,8 +296,15 @@ class Option(BaseInstrument, ABC):
 
 class EuropeanOption(Option):
 
+    __slots__ = ()
+
+    valid_pricing_engines = frozenset(
+        {EuropeanAnalyticalEngine, EuropeanMCEngine}
+    )
+
     DEFAULT_MC_NUM_PATHS = 1000
     DEFAULT_MC_TIME_STEPS = 1
+    DEFAULT_MC_SEED = 42
 
     def __init__(
             self, asset_name, strike, maturity, pricing_engine=None
@@ -164,23 +322,84 @@ class EuropeanOption(Option):
         self.mc_rng = 'pseudorandom'
         self.mc_num_paths = self.DEFAULT_MC_NUM_PATHS
         self.mc_time_steps = self.DEFAULT_MC_TIME_STEPS
-
-    @property
-    def valid_pricing_engines(self):
-        return [EuropeanAnalyticalEngine, EuropeanMCEngine]
+        self.mc_seed = self.DEFAULT_MC_SEED
 
     @property
     def default_pricing_engine(self):
         return EuropeanAnalyticalEngine
 
-    def delta(self):
+    def price_batch(self, batched_mdo):
+        """Prices this option across a whole spot sweep at once.
+
+        The analytical engine evaluates the closed-form formula on the
+        full spot array; the Monte-Carlo engine runs the compiled kernel
+        per spot, which still avoids per-shock market data objects and
+        strategy dispatch.
+
+        :param BatchedEquityMDO batched_mdo: Structure-of-arrays market data
+        :return np.ndarray: Option NPV per spot
+        """
+        maturity = (self.maturity - datetime.date.today()).days / 365
+        cp = int(self.call_or_put)
+        if self._pricing_engine.kind == PricingEngineKind.ANALYTIC_EUROPEAN:
+            return bs_npv_vec(
+                cp=cp,
+                spots=batched_mdo.spots,
+                strike=self.strike,
+                maturity=maturity,
+                rfr=batched_mdo.interest_rate,
+                div=0,  # HACK HACK HACK for dividends
+                vol=batched_mdo.volatility,
+            )
+        npvs = np.empty(len(batched_mdo.spots))
+        for i, spot in enumerate(batched_mdo.spots):
+            npvs[i] = mc_european_npv(
+                cp=cp,
+                spot=spot,
+                strike=self.strike,
+                maturity=maturity,
+                rfr=batched_mdo.interest_rate,
+                div=0,  # HACK HACK HACK for dividends
+                vol=batched_mdo.volatility,
+                num_paths=self.mc_num_paths,
+                seed=self.mc_seed,
+            )
+        return npvs
+
+    def delta(self, market_data_object=None):
+        """Option delta. Given market data with the analytical engine the
+        compiled closed-form kernel is used; otherwise this falls back to
+        the QuantLib engine, which must have priced already."""
+        if (
+                market_data_object is not None
+                and self._pricing_engine.kind
+                == PricingEngineKind.ANALYTIC_EUROPEAN
+        ):
+            asset, rfr = self.mdo_interpreter(
+                instrument=self, market_data_object=market_data_object
+            )
+            maturity = (self.maturity - datetime.date.today()).days / 365
+            return bs_delta(
+                cp=int(self.call_or_put),
+                spot=asset.spot,
+                strike=self.strike,
+                maturity=maturity,
+                rfr=rfr.interest_rate,
+                div=0,  # HACK HACK HACK for dividends
+                vol=asset.volatility,
+            )
         return self.option_obj.delta()
 
 
 class AmericanOption(Option):
 
+    __slots__ = ('_earliest_date',)
+
+    valid_pricing_engines = frozenset({AmericanMCEngine})
+
     DEFAULT_MC_NUM_PATHS = 1000
     DEFAULT_MC_TIME_STEPS = 100
+    DEFAULT_MC_SEED = 42
 
     def __init__(
             self,
@@ -204,42 +423,51 @@ class AmericanOption(Option):
         self.mc_rng = 'pseudorandom'
         self.mc_num_paths = self.DEFAULT_MC_NUM_PATHS
         self.mc_time_steps = self.DEFAULT_MC_TIME_STEPS
+        self.mc_seed = self.DEFAULT_MC_SEED
 
     @property
     def earliest_date(self):
         return self._earliest_date
 
-    @property
-    def valid_pricing_engines(self):
-        return [AmericanMCEngine]
-
     @property
     def default_pricing_engine(self):
         return AmericanMCEngine
 
 
 class EuropeanCallOption(EuropeanOption):
+
+    __slots__ = ()
+
     @property
     def call_or_put(self):
-        return ql.Option.Call
+        return get_ql().Option.Call
 
 
 class EuropeanPutOption(EuropeanOption):
+
+    __slots__ = ()
+
     @property
     def call_or_put(self):
-        return ql.Option.Put
+        return get_ql().Option.Put
 
 
 class AmericanCallOption(AmericanOption):
+
+    __slots__ = ()
+
     @property
     def call_or_put(self):
-        return ql.Option.Call
+        return get_ql().Option.Call
 
 
 class AmericanPutOption(AmericanOption):
+
+    __slots__ = ()
+
     @property
     def call_or_put(self):
-        return ql.Option.Put
+        return get_ql().Option.Put
 
 
 def main():
@@ -249,8 +477,8 @@ def main():
 
     asset_name = "Asset"
     strike = 120
-    maturity = datetime.date(2025, 11, 21)
-    earliest = datetime.date(2024, 11, 21)
+    maturity = datetime.date(2028, 11, 21)
+    earliest = datetime.date(2027, 11, 21)
 
     euro_call_1 = EuropeanCallOption(
         asset_name=asset_name,
@@ -265,7 +493,7 @@ def main():
         asset_name='rfr', interest_rate=0.02
     )
     mdo = MarketDataObject()
-    mdo.add_asset_data(asset_data=[eq_asset_md, ir_asset_md])
+    mdo.add_asset_data_many(asset_data=[eq_asset_md, ir_asset_md])
 
     e_npv = euro_call_1.price(market_data_object=mdo)
     print(f'European option price is: {e_npv}')
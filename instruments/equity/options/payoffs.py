@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-import QuantLib as ql
+from instruments.instrument_helpers import get_ql
 
 
 class PayOffType(ABC):
@@ -14,4 +14,6 @@ class PlainVanillaPayoff(PayOffType):
 
     @staticmethod
     def pay_off(instrument):
-        return ql.PlainVanillaPayoff(instrument.call_or_put, instrument.strike)
+        return get_ql().PlainVanillaPayoff(
+            instrument.call_or_put, instrument.strike
+        )
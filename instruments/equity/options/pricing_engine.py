@@ -1,9 +1,21 @@
 from abc import ABC, abstractmethod
-import QuantLib as ql
+from enum import IntEnum
+from instruments.instrument_helpers import get_ql
+
+
+class PricingEngineKind(IntEnum):
+    """Integer engine discriminator. Hot paths branch on this (an integer
+    compare, or an index into a dispatch tuple) instead of isinstance
+    checks against the engine classes."""
+    ANALYTIC_EUROPEAN = 0
+    MC_EUROPEAN = 1
+    MC_AMERICAN = 2
 
 
 class PricingEngine(ABC):
 
+    kind = None
+
     @staticmethod
     @abstractmethod
     def __call__(instrument, underlying_process):
@@ -14,16 +26,20 @@ class PricingEngine(ABC):
 
 class EuropeanAnalyticalEngine(PricingEngine):
 
+    kind = PricingEngineKind.ANALYTIC_EUROPEAN
+
     @staticmethod
     def __call__(instrument, underlying_process):
-        return ql.AnalyticEuropeanEngine(underlying_process)
+        return get_ql().AnalyticEuropeanEngine(underlying_process)
 
 
 class EuropeanMCEngine(PricingEngine):
 
+    kind = PricingEngineKind.MC_EUROPEAN
+
     @staticmethod
     def __call__(instrument, underlying_process):
-        return ql.MCEuropeanEngine(
+        return get_ql().MCEuropeanEngine(
                 underlying_process,
                 instrument.mc_rng,
                 instrument.mc_time_steps,
@@ -33,11 +49,13 @@ class EuropeanMCEngine(PricingEngine):
 
 class AmericanMCEngine(PricingEngine):
 
+    kind = PricingEngineKind.MC_AMERICAN
+
     @staticmethod
     def __call__(instrument, underlying_process):
-        return ql.MCAmericanEngine(
+        return get_ql().MCAmericanEngine(
                 underlying_process,
                 instrument.mc_rng,
                 instrument.mc_time_steps,
                 requiredSamples=instrument.mc_num_paths
-            )
\ No newline at end of file
+            )
@@ -1,33 +1,127 @@
 from abc import ABC, abstractmethod
-import QuantLib as ql
+from functools import lru_cache
+from instruments.instrument_helpers import get_ql
+
+# Lazily-built singletons: stateless SWIG objects whose construction would
+# otherwise be repeated on every process build. Built on first use so
+# importing this module does not pull in QuantLib.
+_ACT365 = None
+_NULL_CAL = None
+
+
+def _day_count_and_calendar():
+    """The shared Actual365Fixed and NullCalendar singletons."""
+    global _ACT365, _NULL_CAL
+    if _ACT365 is None:
+        ql = get_ql()
+        _ACT365 = ql.Actual365Fixed()
+        _NULL_CAL = ql.NullCalendar()
+    return _ACT365, _NULL_CAL
+
+
+def _today():
+    """The QuantLib evaluation date, which the rest of the pricing chain
+    keys off (unlike ql.Date().todaysDate(), which can diverge from it)."""
+    return get_ql().Settings.instance().evaluationDate
+
+
+# Flat curves are immutable once built, so handles can be shared by every
+# process that needs the same (evaluation date, level) pair; the serial
+# number keys the cache without holding Date proxies.
+
+@lru_cache(maxsize=64)
+def _flat_yield_handle(today_serial, rate):
+    """Shared flat-forward curve handle for the given date and rate."""
+    ql = get_ql()
+    act365, _ = _day_count_and_calendar()
+    return ql.YieldTermStructureHandle(
+        ql.FlatForward(_today(), rate, act365)
+    )
+
+
+@lru_cache(maxsize=64)
+def _flat_vol_handle(today_serial, vol):
+    """Shared constant-vol surface handle for the given date and vol."""
+    ql = get_ql()
+    act365, null_cal = _day_count_and_calendar()
+    return ql.BlackVolTermStructureHandle(
+        ql.BlackConstantVol(_today(), null_cal, vol, act365)
+    )
 
 
 class ProcessType(ABC):
 
-    @staticmethod
+    # Mutable processes keep one QuantLib object graph alive and rebind
+    # quote values in place, so callers must not fingerprint-cache the
+    # returned process by market data.
+    mutable = False
+
     @abstractmethod
-    def __call__(spot, vol, rfr, div):
+    def __call__(self, spot, vol, rfr, div):
         raise NotImplementedError("Process must be implemented as a call.")
 
 
 class StandardBSMProcess(ProcessType):
+    """Black-Scholes-Merton process that builds its QuantLib object graph
+    once and rebinds the spot/vol/rate quote values on later calls.
+
+    setValue notifies the registered engines through the handles, so a
+    reprice costs three quote updates instead of a fresh process, four
+    handles and observer re-registration. The graph is rebuilt only when
+    the evaluation date or dividend yield changes; the dividend curve
+    comes from the shared flat-handle cache since it stays fixed across
+    a sweep.
+    """
+
+    mutable = True
+
+    def __init__(self):
+        self._process = None
+        self._spot_quote = None
+        self._vol_quote = None
+        self._rfr_quote = None
+        self._today_serial = None
+        self._div = None
 
-    @staticmethod
-    def __call__(spot, vol, rfr, div):
-        init_spot = ql.QuoteHandle(ql.SimpleQuote(spot))
-        today = ql.Date().todaysDate()
+    def __call__(self, spot, vol, rfr, div):
+        today_serial = _today().serialNumber()
+        if (
+                self._process is None
+                or today_serial != self._today_serial
+                or div != self._div
+        ):
+            self._build(div=div, today_serial=today_serial)
+        self._spot_quote.setValue(spot)
+        self._vol_quote.setValue(vol)
+        self._rfr_quote.setValue(rfr)
+        return self._process
+
+    def _build(self, div, today_serial):
+        ql = get_ql()
+        act365, null_cal = _day_count_and_calendar()
+        today = _today()
+        self._spot_quote = ql.SimpleQuote(0.0)
+        self._vol_quote = ql.SimpleQuote(0.0)
+        self._rfr_quote = ql.SimpleQuote(0.0)
         rfr_ts = ql.YieldTermStructureHandle(
-            ql.FlatForward(today, rfr, ql.Actual365Fixed())
-        )
-        div_ts = ql.YieldTermStructureHandle(
-            ql.FlatForward(today, div, ql.Actual365Fixed())
+            ql.FlatForward(today, ql.QuoteHandle(self._rfr_quote), act365)
         )
+        div_ts = _flat_yield_handle(today_serial, div)
         vol_ts = ql.BlackVolTermStructureHandle(
             ql.BlackConstantVol(
-                today, ql.NullCalendar(), vol, ql.Actual365Fixed()
+                today, null_cal, ql.QuoteHandle(self._vol_quote), act365
             )
         )
-        bsm_process = ql.BlackScholesMertonProcess(
-            init_spot, div_ts, rfr_ts, vol_ts
+        self._process = ql.BlackScholesMertonProcess(
+            ql.QuoteHandle(self._spot_quote), div_ts, rfr_ts, vol_ts
         )
-        return bsm_process
\ No newline at end of file
+        self._today_serial = today_serial
+        self._div = div
+
+    def __getstate__(self):
+        # The QuantLib graph is SWIG proxies that cannot cross the pickle
+        # boundary; rebuild lazily on the other side.
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
@@ -1,51 +1,130 @@
-from abc import ABC, abstractmethod
-import QuantLib as ql
+import datetime
+from functools import lru_cache
+from instruments.equity.options.bs_kernel import bs_npv
+from instruments.equity.options.exercise_types import EuropeanExercise
+from instruments.equity.options import mc_kernel
+from instruments.equity.options.mc_kernel import (
+    mc_european_npv, mc_european_npv_z
+)
 
 
-class MdoInterpreter(ABC):
+def _analytic_european_fast_path(instrument, asset, rfr):
+    """Closed-form kernel pricing; the QuantLib object graph only pays
+    off for non-analytic engines."""
+    maturity = (instrument.maturity - datetime.date.today()).days / 365
+    return bs_npv(
+        cp=int(instrument.call_or_put),
+        spot=asset.spot,
+        strike=instrument.strike,
+        maturity=maturity,
+        rfr=rfr.interest_rate,
+        div=0,  # HACK HACK HACK for dividends
+        vol=asset.volatility,
+    )
 
-    @staticmethod
-    @abstractmethod
-    def __call__(instrument, market_data_object):
-        raise NotImplementedError(
-            "A MDO interpreter must be implemented as a call."
+
+def _mc_european_fast_path(instrument, asset, rfr):
+    """Terminal-draw Monte-Carlo in a parallel compiled loop; the European
+    payoff needs no intermediate time steps under GBM."""
+    return _mc_price_cached(
+        instrument, asset.spot, asset.volatility, rfr.interest_rate
+    )
+
+
+@lru_cache(maxsize=4096)
+def _mc_price_cached(instrument, spot, vol, rfr):
+    """Monte-Carlo NPV memoized on the market data scalars.
+
+    The kernel is deterministic given the instrument's fixed seed (or the
+    shared common-random-numbers buffer), so repricing the same shock
+    across portfolio variants skips the path sweep entirely. Swapping the
+    shared buffer invalidates entries; Portfolio.set_mc_rng_buffer clears
+    this cache for that reason.
+    """
+    maturity = (instrument.maturity - datetime.date.today()).days / 365
+    shared_z = mc_kernel.get_rng_buffer()
+    if shared_z is not None:
+        return mc_european_npv_z(
+            cp=int(instrument.call_or_put),
+            spot=spot,
+            strike=instrument.strike,
+            maturity=maturity,
+            rfr=rfr,
+            div=0,  # HACK HACK HACK for dividends
+            vol=vol,
+            z=shared_z[:instrument.mc_num_paths],
         )
+    return mc_european_npv(
+        cp=int(instrument.call_or_put),
+        spot=spot,
+        strike=instrument.strike,
+        maturity=maturity,
+        rfr=rfr,
+        div=0,  # HACK HACK HACK for dividends
+        vol=vol,
+        num_paths=instrument.mc_num_paths,
+        seed=instrument.mc_seed,
+    )
 
 
-class StandardMdoInterpreter(MdoInterpreter):       # TODO -> rename this
+# Indexed by PricingEngineKind: integer index instead of isinstance
+# branching. None falls through to the QuantLib path.
+_EUROPEAN_FAST_PATHS = (
+    _analytic_european_fast_path,   # ANALYTIC_EUROPEAN
+    _mc_european_fast_path,         # MC_EUROPEAN
+    None,                           # MC_AMERICAN
+)
 
-    @staticmethod
-    def __call__(instrument, market_data_object):
-        asset = market_data_object.asset_lookup(instrument.asset_name)
-        rfr = market_data_object.asset_lookup('rfr')
-        return asset, rfr
 
+@lru_cache(maxsize=4096)
+def _price_cached(instrument, spot, vol, rfr):
+    """NPV through the QuantLib object graph, memoized on the market data
+    scalars.
 
-class OptionPricingStrategy(ABC):
+    A hedging sweep prices the same instrument at the same shocked market
+    data once per portfolio variant; all repeats after the first are a
+    cache hit. Options hash on (type, engine type, asset, strike,
+    maturity), so equal instruments share entries. The cache assumes the
+    evaluation date is fixed for the lifetime of the entry; clear it via
+    clear_price_cache after changing the date or mutating market data in
+    place.
+    """
+    # HACK HACK HACK for dividends
+    process, engine = instrument.cached_process_and_engine(
+        spot=spot, vol=vol, rfr=rfr, div=0
+    )
+    instrument.option_obj.setPricingEngine(engine)
+    return instrument.option_obj.NPV()
 
-    @staticmethod
-    @abstractmethod
-    def __call__(instrument, market_data_object):
-        raise NotImplementedError(
-            "A pricing strategy must be implemented as a call."
-        )
 
+def clear_price_cache():
+    """Drops all memoized NPVs."""
+    _price_cached.cache_clear()
+    _mc_price_cached.cache_clear()
 
-class StandardOptionStrategy(OptionPricingStrategy):
 
-    @staticmethod
-    def __call__(instrument, market_data_object):
-        asset, rfr = instrument.mdo_interpreter(
-            instrument=instrument, market_data_object=market_data_object
-        )
-        # HACK HACK HACK for dividends
-        process = instrument.underlying_process(
-            spot=asset.spot, vol=asset.volatility, rfr=rfr.interest_rate, div=0
-        )
-        instrument.option_obj.setPricingEngine(
-            instrument.pricing_engine(
-                instrument=instrument,
-                underlying_process=process
-            )
-        )
-        return instrument.option_obj.NPV()
+# Interpreters and strategies are plain module functions: they carry no
+# state, and a stored function avoids the descriptor walk and bound-method
+# allocation that singleton classes with a __call__ cost on every pricing.
+
+def standard_mdo_interpreter(instrument, market_data_object):
+    """Resolves the instrument's underlying asset and the risk free rate
+    from the market data object."""
+    asset = market_data_object.asset_lookup(instrument.asset_name)
+    rfr = market_data_object.asset_lookup('rfr')
+    return asset, rfr
+
+
+def standard_option_strategy(instrument, market_data_object):
+    """Prices an option, dispatching European payoffs to the compiled
+    fast paths and everything else through the memoized QuantLib path."""
+    asset, rfr = instrument.mdo_interpreter(
+        instrument=instrument, market_data_object=market_data_object
+    )
+    if instrument.exercise_type is EuropeanExercise:
+        fast_path = _EUROPEAN_FAST_PATHS[instrument.pricing_engine.kind]
+        if fast_path is not None:
+            return fast_path(instrument, asset, rfr)
+    return _price_cached(
+        instrument, asset.spot, asset.volatility, rfr.interest_rate
+    )
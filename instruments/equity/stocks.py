@@ -1,35 +1,33 @@
 import logging
+from dataclasses import dataclass
 from instruments.instrument import BaseInstrument
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
 class Stock(BaseInstrument):
+    """A cash equity position. Frozen: structurally-equal stocks are
+    interchangeable for pricing, which also makes them usable as cache
+    and dedup keys."""
 
-    def __init__(self, asset_name, num_shares):
-        super().__init__()
-        self.asset_name = asset_name
-        self.num_shares = num_shares
-        self.price_cache = {}
-
-    def _price(self, spot, num_shares):
-        if (spot, num_shares) in self.price_cache:
-            logger.info(
-                f'Fetching price for spot {spot} and '
-                f'num_shares {num_shares} from cache.'
-            )
-            calc_price = self.price_cache[(spot, num_shares)]
-        else:
-            logger.info(
-                f'Calling price with spot {spot} and num_shares {num_shares}.'
-            )
-            calc_price = num_shares * spot
-            self.price_cache[(spot, num_shares)] = calc_price
-        return calc_price
+    asset_name: str
+    num_shares: float
 
     def price(self, market_data_object):
-        asset = market_data_object.asset_lookup(self.asset_name)
-        return self._price(spot=asset.spot, num_shares=self.num_shares)
+        # A stock price is one multiply; the old per-call cache (dict
+        # lookup, tuple hash, log formatting) cost more than recomputing.
+        spot = market_data_object.asset_lookup(self.asset_name).spot
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Pricing stock %s: %s shares at spot %s.',
+                self.asset_name, self.num_shares, spot
+            )
+        return self.num_shares * spot
+
+    def price_batch(self, batched_mdo):
+        """Spot-sweep prices in one vectorized multiply."""
+        return self.num_shares * batched_mdo.spots
 
 
 def stock_example():
@@ -18,8 +18,28 @@ class BaseInstrument(ABC):
     of caching within calculations.
     """
 
+    __slots__ = ()
+
+    # Structurally-equal instruments price identically, so portfolios may
+    # price one representative and scale by the summed quantity. Set to
+    # False on subclasses where repeat pricings intentionally differ
+    # (e.g. stateful Monte-Carlo sampling).
+    dedup_safe = True
+
     @abstractmethod
     def price(self, market_data_object):
         raise NotImplementedError(
             "Method 'price' should be implemented for all instruments."
         )
+
+    def price_batch(self, batched_mdo):
+        """Prices this instrument across a whole scenario sweep at once.
+
+        Optional; instruments with a vectorized pricing path override this.
+
+        :param BatchedEquityMDO batched_mdo: Structure-of-arrays market data
+        :return np.ndarray: NPV per scenario
+        """
+        raise NotImplementedError(
+            f"Batch pricing is not implemented for {type(self).__name__}."
+        )
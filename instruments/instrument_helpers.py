@@ -1,11 +1,32 @@
-import QuantLib as ql
+from functools import lru_cache
 
+# QuantLib is imported lazily: the SWIG module load costs a noticeable
+# chunk of startup wall-clock, and cold paths (the Numba analytic and MC
+# kernels, scenario generation) never need it.
+_ql = None
 
+
+def get_ql():
+    """Imports QuantLib on first use and returns the module.
+
+    :return module: The QuantLib module
+    """
+    global _ql
+    if _ql is None:
+        import QuantLib
+        _ql = QuantLib
+    return _ql
+
+
+@lru_cache(maxsize=4096)
 def dt_2_qldt(dt):
     """Transform a datetimte.date into a Quant Lib date.
 
+    Cached so identical dates share one ql.Date: the construction crosses
+    SWIG and callers (exercise builders, term structures) hit the same few
+    dates repeatedly. The returned date must not be mutated.
+
     :param datetime.date dt: Input date
     :return QuantLib Date: Quant Lib date
     """
-    return ql.Date(dt.day, dt.month, dt.year)
-
+    return get_ql().Date(dt.day, dt.month, dt.year)
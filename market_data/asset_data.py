@@ -1,22 +1,35 @@
 from abc import ABC
+from dataclasses import dataclass
 
 
+@dataclass(slots=True)
 class AssetMarketData(ABC):
-
-    def __init__(self, asset_name):
-        self.asset_name = asset_name
+    asset_name: str
 
 
+@dataclass(slots=True)
 class EquityAssetMarketData(AssetMarketData):
-
-    def __init__(self, asset_name, spot, volatility):
-        super(EquityAssetMarketData, self).__init__(asset_name=asset_name)
-        self.spot = spot
-        self.volatility = volatility
+    spot: float
+    volatility: float
 
 
+@dataclass(slots=True)
 class InterestRateAssetMarketData(AssetMarketData):
+    interest_rate: float
+
 
-    def __init__(self, asset_name, interest_rate):
-        super(InterestRateAssetMarketData, self).__init__(asset_name=asset_name)
+class BatchedEquityMDO:
+    """Structure-of-arrays market data for a sweep of equity scenarios.
+
+    One spot array plus shared scalar volatility and rate replaces a list
+    of per-shock market data objects, so batch pricers can run over the
+    whole sweep in vectorized passes.
+    """
+
+    __slots__ = ('asset_name', 'spots', 'volatility', 'interest_rate')
+
+    def __init__(self, asset_name, spots, volatility, interest_rate):
+        self.asset_name = asset_name
+        self.spots = spots
+        self.volatility = volatility
         self.interest_rate = interest_rate
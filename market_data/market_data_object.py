@@ -1,14 +1,8 @@
 import logging
-from collections.abc import Iterable
 from market_data.asset_data import AssetMarketData
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
-
 
 class MarketDataObject:
 
@@ -16,19 +10,21 @@ class MarketDataObject:
         self.scenario_date = scenario_date
         self.asset_data_store = {}
 
-    def add_asset_data(self, asset_data):
-        if not isinstance(asset_data, Iterable):
-            asset_data = [asset_data]
+    def add_asset_data(self, asset):
+        """Adds a single asset's market data, overwriting any data held
+        under the same asset name."""
+        store = self.asset_data_store
+        if asset.asset_name in store:
+            logger.info(
+                'Overwriting asset market data %s with asset name %s.',
+                store[asset.asset_name], asset.asset_name
+            )
+        store[asset.asset_name] = asset
 
+    def add_asset_data_many(self, asset_data):
+        """Adds market data for each asset in an iterable."""
         for asset in asset_data:
-            if asset.asset_name in self.asset_data_store.keys():
-                overwritten_data = self.asset_data_store[asset.asset_name]
-                logger.info(
-                    f'Overwriting asset market data {overwritten_data} '
-                    f'with asset name {asset.asset_name}.'
-                )
-
-            self.asset_data_store[asset.asset_name] = asset
+            self.add_asset_data(asset)
 
     def asset_lookup(self, asset_name, error_if_missing=True):
         asset_data = self.asset_data_store[asset_name]
@@ -41,6 +37,35 @@ class MarketDataObject:
         return asset_data
 
 
+class FastMDO:
+    """Fixed-schema market data object for the common one-equity-plus-rates
+    setup.
+
+    Scenario sweeps resolve assets inside their innermost loop; with the
+    schema fixed, slot attribute access plus a single name compare replaces
+    the dict store, and callers that know the schema can read ``equity`` /
+    ``rfr`` directly and skip name resolution entirely.
+    """
+
+    __slots__ = ('equity', 'rfr', 'scenario_date')
+
+    def __init__(self, equity, rfr, scenario_date=None):
+        self.equity = equity
+        self.rfr = rfr
+        self.scenario_date = scenario_date
+
+    def asset_lookup(self, asset_name, error_if_missing=True):
+        if asset_name == self.equity.asset_name:
+            return self.equity
+        if asset_name == self.rfr.asset_name:
+            return self.rfr
+        message = f'No asset {asset_name} found in asset data store.'
+        if error_if_missing:
+            raise KeyError(message)
+        logger.warning(message)
+        return None
+
+
 def main():
     from market_data import asset_data
     eq_asset_md = asset_data.EquityAssetMarketData(
@@ -50,7 +75,7 @@ def main():
         asset_name='rfr', interest_rate=0.02
     )
     mdo = MarketDataObject()
-    mdo.add_asset_data(asset_data=[eq_asset_md, ir_asset_md])
+    mdo.add_asset_data_many(asset_data=[eq_asset_md, ir_asset_md])
     x = mdo.asset_lookup('example_stock')
     temp = 1
 
@@ -5,22 +5,29 @@ import numpy as np
 from matplotlib import pyplot
 
 
-def generate_log_normal_shocks(vol, num_shocks=780):
+def generate_log_normal_shocks(vol, num_shocks=780, seed=None):
     """Generate a vector of log normal shocks with given volatility.
 
     Log shock = exp(vol * N(0,1))
     S1 = S0 * (Log shock)
 
+    Draws come from the PCG64 generator (faster than the legacy global
+    RandomState) and the scale/exp are applied in place on the one
+    buffer, so the whole vector costs a single allocation.
+
     :param float vol: Volatility in standard units
     :param int num_shocks: Number of shocks to produce
+    :param int seed: Seed for the generator; None draws fresh entropy
     :return [int]: Vector of shocks
     """
 
     if vol < 0:
         raise TypeError(f"Vol must be zero or greater, not {vol}.")
 
-    rand_norm_vector = np.random.normal(loc=0, scale=1, size=num_shocks)
-    shock_vector = np.exp(vol * rand_norm_vector)
+    rng = np.random.default_rng(seed)
+    shock_vector = rng.standard_normal(num_shocks)
+    np.multiply(shock_vector, vol, out=shock_vector)
+    np.exp(shock_vector, out=shock_vector)
 
     return shock_vector
 
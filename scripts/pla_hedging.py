@@ -1,15 +1,14 @@
 import numpy as np
 import logging
 import datetime
+import multiprocessing
 from statistics import pla_stats
-from core.portfolio import Portfolio
-from core.deal import Deal
 from instruments.equity import stocks
 from instruments.equity.options import options
 from instruments.equity.options import pricing_engine
 from matplotlib import pyplot
 from market_data import asset_data, scenario_generator
-from market_data.market_data_object import MarketDataObject
+from market_data.market_data_object import FastMDO
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +18,14 @@ logging.basicConfig(
 )
 
 
-def hedging_example():
+def _ratio_pla_stats(fo_row, risk_row):
+    """PLA statistics for one hedge ratio's PnL rows. Module level so it
+    can cross the pickle boundary into worker processes."""
+    result = pla_stats.pla_stats(fo_row, risk_row)
+    return result.ks_value, result.spearman_value
+
+
+def hedging_example(workers=None):
     """
     This example assumes:
     Portfolio PV = Call_Option(St) - k * Stock(St)
@@ -33,6 +39,8 @@ def hedging_example():
     Underlying volatility = vol
     Number of simulations of spot price shocks = n_shocks
     Number of hedging ratios to test = n_ratios
+    The per-ratio PLA statistics are independent, so with workers > 1
+    they fan out over a process pool.
 
     1) Simulate a set of spot prices
     2) Select a set of hedging ratios (0 to 1)
@@ -57,7 +65,7 @@ def hedging_example():
     num_stock_points = 51
     stock_num_diff = 2
     maturity = datetime.date(2028, 1, 1)
-    num_stocks = [i * stock_num_diff for i in range(num_stock_points)]
+    num_stocks = np.arange(num_stock_points) * stock_num_diff
     shocks = scenario_generator.generate_log_normal_shocks(vol=historical_vol, num_shocks=250)
     rand_spot = base_spot * shocks
 
@@ -69,21 +77,14 @@ def hedging_example():
         asset_name=asset_name, spot=base_spot, volatility=implied_vol
     )
 
-    base_mdo = MarketDataObject()
-    base_mdo.add_asset_data([rfr_asset, base_eq_asset])
-
-    shocked_eq_assets = [
-        asset_data.EquityAssetMarketData(
-            asset_name=asset_name, spot=shocked_spot, volatility=implied_vol
-        ) for shocked_spot in rand_spot
-    ]
+    base_mdo = FastMDO(equity=base_eq_asset, rfr=rfr_asset)
 
-    shocked_mdos = []
-
-    for shocked_eq_asset in shocked_eq_assets:
-        mdo = MarketDataObject()
-        mdo.add_asset_data([rfr_asset, shocked_eq_asset])
-        shocked_mdos.append(mdo)
+    # Structure-of-arrays market data: one spot array plus shared scalars
+    # instead of one market data object per shock.
+    batched_mdo = asset_data.BatchedEquityMDO(
+        asset_name=asset_name, spots=rand_spot, volatility=implied_vol,
+        interest_rate=rfr
+    )
 
     option_analytical = options.EuropeanPutOption(
         asset_name=asset_name,
@@ -101,57 +102,50 @@ def hedging_example():
 
     stock = stocks.Stock(asset_name=asset_name, num_shares=1)
 
-    opt_deal_a = Deal(instrument=option_analytical, quantity=num_options)
-    opt_deal_mc = Deal(instrument=option_mc, quantity=num_options)
+    # Each instrument prices the whole shock sweep in one batch call; the
+    # (ratio, shock) PnL matrices then come from broadcasting the per-unit
+    # PnLs against the deal quantities, with no per-shock pricer loop.
+    stock_unit_pnls = stock.price_batch(batched_mdo) - stock.price(base_mdo)
+    stock_pnl_matrix = num_stocks[:, None] * stock_unit_pnls[None, :]
 
-    stock_deals = [Deal(instrument=stock, quantity=x) for x in num_stocks]
-
-    portfolio_as = []
-    portfolio_mcs = []
-
-    for stock_deal in stock_deals:
-        temp_portfolio = Portfolio()
-        temp_portfolio.add_deal(stock_deal)
-        temp_portfolio.add_deal(opt_deal_a)
-        portfolio_as.append(temp_portfolio)
-
-    for stock_deal in stock_deals:
-        temp_portfolio = Portfolio()
-        temp_portfolio.add_deal(stock_deal)
-        temp_portfolio.add_deal(opt_deal_mc)
-        portfolio_mcs.append(temp_portfolio)
+    analytical_put_pnls = (
+        option_analytical.price_batch(batched_mdo)
+        - option_analytical.price(base_mdo)
+    )
+    analytical_pnl_matrix = (
+        num_options * analytical_put_pnls[None, :] + stock_pnl_matrix
+    )
 
-    base_npvs_a = [x.price(base_mdo) for x in portfolio_as]
-    base_npvs_mc = [x.price(base_mdo) for x in portfolio_mcs]
+    mc_put_pnls = (
+        option_mc.price_batch(batched_mdo) - option_mc.price(base_mdo)
+    )
+    mc_pnl_matrix = num_options * mc_put_pnls[None, :] + stock_pnl_matrix
 
-    original_analytical_delta = option_analytical.delta()
+    original_analytical_delta = option_analytical.delta(base_mdo)
     logger.info(f'Original delta of analytical option is {original_analytical_delta}.')
-    portfolio_delta = [original_analytical_delta*num_options + i for i in num_stocks]
-    hedging_ratio = [(-i/(original_analytical_delta*num_options))*100 for i in num_stocks]
-
-    sp_values = []
-    kstest_values = []
-    pnls = {}
-
-    for portfolio_a, portfolio_mc, base_npv_a, base_npv_mc, num_stock in zip(
-            portfolio_as, portfolio_mcs, base_npvs_a, base_npvs_mc, num_stocks
-    ):
-        analytical_npvs = []
-        mc_npvs = []
-        for shocked_mdo in shocked_mdos:
-
-            shocked_npvs_per_portfolio_a = portfolio_a.price(shocked_mdo)
-            analytical_npvs.append(shocked_npvs_per_portfolio_a)
-
-            shocked_npvs_per_portfolio_mc = portfolio_mc.price(shocked_mdo)
-            mc_npvs.append(shocked_npvs_per_portfolio_mc)
-
-        fo_portfolio_pnls = [y - base_npv_a for y in analytical_npvs]
-        risk_portfolio_pnls = [y - base_npv_mc for y in mc_npvs]
-
-        sp_values.append(pla_stats.pla_stats(fo_portfolio_pnls, risk_portfolio_pnls).spearman_value)
-        kstest_values.append(pla_stats.pla_stats(fo_portfolio_pnls, risk_portfolio_pnls).ks_value)
-        pnls[num_stock] = (fo_portfolio_pnls, risk_portfolio_pnls)
+    portfolio_delta = original_analytical_delta * num_options + num_stocks
+    hedging_ratio = -num_stocks / (original_analytical_delta * num_options) * 100
+
+    pnls = {
+        num_stock: (analytical_pnl_matrix[i], mc_pnl_matrix[i])
+        for i, num_stock in enumerate(num_stocks)
+    }
+
+    if workers is not None and workers > 1:
+        # Spawned workers: forking after the compiled MC kernels have run
+        # can deadlock on the JIT runtime's thread pool.
+        with multiprocessing.get_context('spawn').Pool(workers) as pool:
+            ratio_stats = pool.starmap(
+                _ratio_pla_stats, zip(analytical_pnl_matrix, mc_pnl_matrix)
+            )
+        kstest_values = [ks for ks, _ in ratio_stats]
+        sp_values = [spearman for _, spearman in ratio_stats]
+    else:
+        batch_result = pla_stats.pla_stats_batch(
+            analytical_pnl_matrix, mc_pnl_matrix
+        )
+        kstest_values = batch_result.ks_value
+        sp_values = batch_result.spearman_value
 
     logger.info(f'Original delta of analytical option is {original_analytical_delta}.')
 